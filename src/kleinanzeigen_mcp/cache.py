@@ -0,0 +1,54 @@
+"""Small in-process caches shared by the client and the MCP tools."""
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """
+    LRU cache whose entries expire after a fixed number of seconds.
+
+    Not thread-safe; meant to be used from a single event loop.
+    A ttl of 0 or less disables caching.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # key -> (expires_at, value), oldest first
+        self._entries: OrderedDict[Hashable, Tuple[float, V]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Return the cached value if present and not expired."""
+        hit = self._entries.get(key)
+        if not hit:
+            return None
+        expires_at, value = hit
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: V, ttl: Optional[float] = None):
+        """
+        Store a value, evicting the least recently used entry when full.
+
+        ttl overrides the cache-wide TTL for this entry.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,25 +1,239 @@
 """Kleinanzeigen scraping client - centralized interface to the website."""
+import asyncio
+import functools
 import logging
-from typing import Optional, List, Dict, Any
+import os
+from contextlib import asynccontextmanager
+from typing import Optional, List, Dict, Any, AsyncIterator, Tuple, Union
 from urllib.parse import urlencode
-from playwright.async_api import Page, Browser, async_playwright
+import httpx
+from playwright.async_api import Page, Browser, BrowserContext, Playwright, Route, async_playwright
+from selectolax.lexbor import LexborHTMLParser
 import re
 
-from .types import ListingSummary, ListingDetails, SearchError, DetailFetchError
+from .cache import TTLCache
+from .types import (
+    ListingSummary, ListingDetails, Location, Seller,
+    KleinanzeigenError, SearchError, DetailFetchError
+)
 
 logger = logging.getLogger(__name__)
 
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Headers for the plain HTTP fast path
+_HTTP_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept-Language": "de-DE,de;q=0.9",
+}
+# Keep enough idle connections around for concurrent page fetches
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=64,
+    max_keepalive_connections=32,
+    # Tool calls arrive in bursts with pauses in between; keep connections warm
+    keepalive_expiry=30.0
+)
+
+# Settings shared by every browser context
+_CONTEXT_OPTS = {
+    "user_agent": USER_AGENT,
+    "locale": "de-DE",
+    "viewport": {"width": 1280, "height": 800},
+    "java_script_enabled": True,
+}
+
+# Number of warm browser contexts kept ready for page work
+CONTEXT_POOL_SIZE = 4
+# Pooled contexts are recycled after this many uses to keep browser memory bounded
+CONTEXT_MAX_USES = 50
+# Maximum number of search result pages fetched at the same time
+SEARCH_CONCURRENCY = CONTEXT_POOL_SIZE
+# Maximum number of listing details kept in the in-process cache
+DETAIL_CACHE_SIZE = 256
+
+# Statuses the site answers with when it wants a bot check instead of the page
+_BLOCKED_STATUS_CODES = frozenset({403, 429, 503})
+# Marker of a Cloudflare challenge page served with a 200 status
+_CHALLENGE_MARKER = b"cf-challenge"
+
+# Search result items, excluding promoted top ads
+_LISTING_ITEM_SELECTOR = ".ad-listitem:not(.is-topad):not(.badge-hint-pro-small-srp)"
+
+# Resources the scraper never needs - extraction only reads DOM text and attributes
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+_BLOCKED_URL_PATTERN = re.compile(r"analytics|googletagmanager|doubleclick|facebook")
+
+# Text cleanup patterns, compiled once
+_SPACES_PATTERN = re.compile(r'[ \t]+')
+_NEWLINES_PATTERN = re.compile(r'\n+')
+# First number in a price label, with German thousands separators ("1.299 € VB")
+_PRICE_PATTERN = re.compile(r'\d[\d.]*')
+# Strips the thousands separators from a _PRICE_PATTERN match
+_THOUSANDS_SEPARATOR_TABLE = str.maketrans("", "", ".")
+
+
+# Shared by the extraction scripts below: poll until a condition holds or the timeout passes.
+# Pages are opened with wait_until="commit", so the scripts wait for the DOM themselves.
+_JS_WAIT_FOR = """
+const waitFor = async (done, timeout) => {
+    const start = performance.now();
+    while (!done() && performance.now() - start < timeout) {
+        await new Promise(resolve => setTimeout(resolve, 50));
+    }
+};
+"""
+
+# Waits for the results page, then reads all result cards in one round-trip.
+# Takes the item selector as argument. Returns null if no results page showed up.
+_EXTRACT_LISTINGS_JS = """
+async (itemSelector) => {
+""" + _JS_WAIT_FOR + """
+    await waitFor(() => document.readyState !== 'loading', 30000);
+    await waitFor(() => document.querySelector('.ad-listitem, .l-splitpage--no-results'), 10000);
+    if (!document.querySelector('.ad-listitem, .l-splitpage--no-results')) return null;
+    return Array.from(document.querySelectorAll(itemSelector + ' article')).map(a => ({
+        adid: a.dataset.adid || '',
+        href: a.dataset.href || '',
+        title: (a.querySelector('h2.text-module-begin a.ellipsis')?.innerText || '').trim(),
+        price: a.querySelector('p.aditem-main--middle--price-shipping--price')?.innerText || '',
+        description: (a.querySelector('p.aditem-main--middle--description')?.innerText || '').trim(),
+    }));
+}
+"""
+
+# Waits for the detail page (and briefly for the script-filled view counter),
+# then reads every field in one round-trip
+_EXTRACT_DETAILS_JS = """
+async () => {
+""" + _JS_WAIT_FOR + """
+    const text = (sel) => (document.querySelector(sel)?.innerText || '').trim();
+    const table = (sel) => {
+        const out = {};
+        document.querySelectorAll(sel + ' .addetailslist--detail').forEach(item => {
+            const label = item.querySelector('.addetailslist--detail--label');
+            const value = item.querySelector('.addetailslist--detail--value');
+            if (label && value) out[label.innerText.trim()] = value.innerText.trim();
+        });
+        return out;
+    };
+    await waitFor(() => document.readyState !== 'loading', 30000);
+    await waitFor(() => text('#viewad-cntr-num'), 2500);
+    return {
+        id: text('#viewad-ad-id-box > ul > li:nth-child(2)'),
+        categories: Array.from(document.querySelectorAll('.breadcrump-link'))
+            .map(e => e.innerText.trim()).filter(Boolean),
+        title: text('#viewad-title'),
+        sold_badge: document.querySelector('.badge-sold') !== null,
+        price: text('#viewad-price'),
+        views: text('#viewad-cntr-num'),
+        description: text('#viewad-description-text'),
+        // Lazy-loaded gallery images only carry the URL in a data attribute
+        images: Array.from(document.querySelectorAll('#viewad-image img'))
+            .map(img => img.getAttribute('src') || img.dataset.imgsrc || img.dataset.imgSrc)
+            .filter(Boolean),
+        shipping: text('.boxedarticle--details--shipping'),
+        location: text('#viewad-locality'),
+        seller_name: text('.userprofile--name'),
+        details: table('#viewad-details'),
+        features: table('#viewad-configuration'),
+    };
+}
+"""
+
+
+@functools.lru_cache(maxsize=256)
+def _build_search_url_template(
+    base_url: str,
+    query: Optional[str],
+    location: Optional[str],
+    radius: Optional[int],
+    min_price: Optional[int],
+    max_price: Optional[int]
+) -> str:
+    """Build the search URL with a {page} placeholder; repeated searches hit the cache."""
+    # Build URL with price filter
+    price_path = ""
+    if min_price is not None or max_price is not None:
+        min_price_str = str(min_price) if min_price is not None else ""
+        max_price_str = str(max_price) if max_price is not None else ""
+        price_path = f"/preis:{min_price_str}:{max_price_str}"
+    
+    search_path = f"{price_path}/s-seite:{{page}}"
+    
+    # Build query parameters
+    params = {}
+    if query:
+        params['keywords'] = query
+    if location:
+        params['locationStr'] = location
+    if radius:
+        params['radius'] = radius
+    
+    return base_url + search_path + ("?" + urlencode(params) if params else "")
+
+
+async def _block_unneeded_resources(route: Route):
+    """Abort requests for assets and trackers, let everything else through."""
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or _BLOCKED_URL_PATTERN.search(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
 
 class KleinanzeigenClient:
     """
     Centralized client for interacting with Kleinanzeigen.de.
     Manages browser lifecycle and provides clean API for operations.
+    
+    All started clients in a process share one Playwright instance and
+    browser; each client only owns its browser contexts. The browser is
+    closed when the last client closes, or by shutdown().
     """
     
-    def __init__(self):
+    _shared_playwright: Optional[Playwright] = None
+    _shared_browser: Optional[Browser] = None
+    # Number of started clients using the current _shared_browser
+    _browser_users = 0
+    _browser_lock = asyncio.Lock()
+    
+    def __init__(
+        self,
+        isolate_per_request: bool = False,
+        http_client: Optional[httpx.AsyncClient] = None,
+        http_first: bool = True
+    ):
+        """
+        Args:
+            isolate_per_request: Give every browser page its own fresh context
+                (no shared cookies/cache between requests) instead of using the
+                warm context pool. Useful when serving unrelated users.
+            http_client: HTTP client to use for plain page fetches instead of
+                creating one in start(). The caller stays responsible for
+                closing it.
+            http_first: Try a plain HTTP request before the browser for
+                search pages. Disable it when the HTTP requests are being
+                blocked anyway, to skip the wasted round trip.
+        """
         self.base_url = "https://www.kleinanzeigen.de"
-        self.playwright = None
+        self.isolate_per_request = isolate_per_request
+        self.http_first = http_first
         self.browser: Optional[Browser] = None
+        self.http: Optional[httpx.AsyncClient] = http_client
+        self._owns_http = http_client is None
+        # Pool of (context, use_count) pairs, filled in start()
+        self._context_pool: Optional[asyncio.Queue[Tuple[BrowserContext, int]]] = None
+        # JavaScript-disabled context for search pages, which are server-rendered
+        self._nojs_context: Optional[BrowserContext] = None
+        self._context_lock = asyncio.Lock()
+        self._search_semaphore = asyncio.Semaphore(SEARCH_CONCURRENCY)
+        # Recently fetched details by listing_id.
+        # DETAIL_CACHE_TTL=0 disables caching (e.g. when running several server processes).
+        self._detail_cache: TTLCache[ListingDetails] = TTLCache(
+            DETAIL_CACHE_SIZE, float(os.environ.get("DETAIL_CACHE_TTL", "300"))
+        )
+        # Detail fetches in progress, so concurrent callers share one navigation
+        self._inflight_details: Dict[str, asyncio.Task[ListingDetails]] = {}
         
     async def __aenter__(self):
         """Async context manager entry - initializes browser."""
@@ -31,28 +245,183 @@ async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.close()
         
     async def start(self):
-        """Initialize Playwright and browser."""
+        """Initialize HTTP client, Playwright and browser."""
         try:
-            self.playwright = await async_playwright().start()
-            self.browser = await self.playwright.chromium.launch(
-                headless=True,
-                args=['--no-sandbox', '--disable-dev-shm-usage']
-            )
+            if self.http is None:
+                self.http = httpx.AsyncClient(
+                    http2=True,
+                    headers=_HTTP_HEADERS,
+                    limits=_HTTP_LIMITS,
+                    # Short timeouts: a stalled fetch falls back to the browser
+                    timeout=httpx.Timeout(10.0, connect=3.0),
+                    follow_redirects=True
+                )
+            self.browser = await self._acquire_browser()
+            if not self.isolate_per_request:
+                self._context_pool = asyncio.Queue()
+                for _ in range(CONTEXT_POOL_SIZE):
+                    self._context_pool.put_nowait((await self.new_context(), 0))
+                self._nojs_context = await self.new_context(java_script_enabled=False)
             logger.info("Browser initialized successfully")
         except Exception as e:
-            logger.error(f"Failed to start browser: {e}")
+            logger.error("Failed to start browser: %s", e)
+            # Don't leak whatever was set up before the failure
+            await self.close()
             raise SearchError(f"Browser initialization failed: {e}")
     
     async def close(self):
-        """Clean up browser and Playwright resources."""
+        """Clean up HTTP client and browser contexts, and release the shared browser.
+        
+        Resets the client so start() can be called again.
+        """
+        # A caller-provided HTTP client stays open for the caller
+        http = self.http if self._owns_http else None
+        if http is not None:
+            self.http = None
+        pool, self._context_pool = self._context_pool, None
+        nojs_context, self._nojs_context = self._nojs_context, None
         try:
+            if http is not None:
+                await http.aclose()
+            if pool:
+                while not pool.empty():
+                    context, _ = pool.get_nowait()
+                    await context.close()
+            if nojs_context:
+                await nojs_context.close()
+        except Exception as e:
+            logger.error("Error closing browser contexts: %s", e)
+        finally:
             if self.browser:
-                await self.browser.close()
-            if self.playwright:
-                await self.playwright.stop()
-            logger.info("Browser closed successfully")
+                browser, self.browser = self.browser, None
+                await self._release_browser(browser)
+    
+    @classmethod
+    async def _acquire_browser(cls) -> Browser:
+        """Return the shared browser, launching it if needed, and register a user."""
+        async with cls._browser_lock:
+            if cls._shared_browser is None or not cls._shared_browser.is_connected():
+                # First client, or the browser crashed / the CDP connection dropped.
+                # Clients of a dead browser don't count for the new one.
+                await cls._stop_browser()
+                cls._browser_users = 0
+                cls._shared_playwright = await async_playwright().start()
+                cdp_url = os.environ.get("CHROMIUM_CDP_URL")
+                if cdp_url:
+                    # Attach to an already running Chromium instead of launching one
+                    cls._shared_browser = await cls._shared_playwright.chromium.connect_over_cdp(cdp_url)
+                    logger.info("Connected to Chromium over CDP at %s", cdp_url)
+                else:
+                    cls._shared_browser = await cls._shared_playwright.chromium.launch(
+                        headless=True,
+                        args=['--no-sandbox', '--disable-dev-shm-usage']
+                    )
+            cls._browser_users += 1
+            return cls._shared_browser
+    
+    @classmethod
+    async def _release_browser(cls, browser: Browser):
+        """Unregister a user of browser and close it once nobody uses it."""
+        async with cls._browser_lock:
+            if browser is not cls._shared_browser:
+                # Already replaced after a crash (or shut down); nothing to release
+                return
+            cls._browser_users = max(0, cls._browser_users - 1)
+            if cls._browser_users == 0:
+                await cls._stop_browser()
+    
+    @classmethod
+    async def _stop_browser(cls):
+        """Close the shared browser and Playwright. Caller holds _browser_lock."""
+        browser, playwright = cls._shared_browser, cls._shared_playwright
+        cls._shared_browser = cls._shared_playwright = None
+        try:
+            if browser:
+                await browser.close()
+            if playwright:
+                await playwright.stop()
+            if browser or playwright:
+                logger.info("Browser closed successfully")
         except Exception as e:
-            logger.error(f"Error closing browser: {e}")
+            logger.error("Error closing browser: %s", e)
+    
+    @classmethod
+    async def shutdown(cls):
+        """Close the shared browser even if clients still use it (e.g. at process exit)."""
+        async with cls._browser_lock:
+            cls._browser_users = 0
+            await cls._stop_browser()
+    
+    def is_connected(self) -> bool:
+        """Return whether the client is started and its browser is still alive."""
+        return self.browser is not None and self.browser.is_connected()
+    
+    async def new_context(self, **overrides) -> BrowserContext:
+        """
+        Create an isolated browser context with the client's default settings.
+        
+        Keyword arguments override the defaults (e.g. java_script_enabled=False).
+        Assets and trackers are blocked for every page of the context.
+        The caller is responsible for closing the context.
+        
+        Raises:
+            KleinanzeigenError: If the client hasn't been started
+        """
+        browser = self.browser
+        if browser is None:
+            raise KleinanzeigenError("Browser not initialized. Call start() first.")
+        async with self._context_lock:
+            context = await browser.new_context(**{**_CONTEXT_OPTS, **overrides})
+        # Registered once per context instead of on every new page
+        await context.route("**/*", _block_unneeded_resources)
+        return context
+    
+    @asynccontextmanager
+    async def _nojs_page(self) -> AsyncIterator[Page]:
+        """Open a page with JavaScript disabled (no page scripts, trackers or consent banners)."""
+        context = self._nojs_context or await self.new_context(java_script_enabled=False)
+        page = None
+        try:
+            page = await context.new_page()
+            yield page
+        finally:
+            if page:
+                await page.close()
+            if context is not self._nojs_context:
+                await context.close()
+    
+    @asynccontextmanager
+    async def _pooled_page(self) -> AsyncIterator[Page]:
+        """Borrow a fresh page from one of the pooled browser contexts."""
+        if self.isolate_per_request:
+            context = await self.new_context()
+            try:
+                # Closing the context closes its pages too
+                yield await context.new_page()
+            finally:
+                await context.close()
+            return
+        
+        pool = self._context_pool
+        assert pool is not None, "start() creates the context pool"
+        context, uses = await pool.get()
+        page: Optional[Page] = None
+        try:
+            page = await context.new_page()
+            yield page
+        finally:
+            if page:
+                await page.close()
+            uses += 1
+            if uses >= CONTEXT_MAX_USES:
+                # Long-lived contexts leak memory, so swap in a fresh one
+                try:
+                    fresh_context = await self.new_context()
+                    await context.close()
+                    context, uses = fresh_context, 0
+                except Exception as e:
+                    logger.warning("Failed to recycle browser context: %s", e)
+            pool.put_nowait((context, uses))
     
     async def search_listings(
         self,
@@ -80,113 +449,246 @@ async def search_listings(
         Raises:
             SearchError: If search operation fails
         """
-        if not self.browser:
+        results = [
+            listing async for listing in self.iter_listings(
+                query=query,
+                location=location,
+                radius=radius,
+                min_price=min_price,
+                max_price=max_price,
+                page_count=page_count
+            )
+        ]
+        logger.info("Search completed: %s listings found", len(results))
+        return results
+    
+    async def iter_listings(
+        self,
+        query: Optional[str] = None,
+        location: Optional[str] = None,
+        radius: Optional[int] = None,
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None,
+        page_count: int = 1
+    ) -> AsyncIterator[ListingSummary]:
+        """
+        Search for listings, yielding them as soon as their page is fetched.
+        
+        All pages are requested concurrently, but listings are yielded in
+        page order: page 1 results arrive after one page fetch no matter how
+        large page_count is. A failing later page is logged and skipped.
+        Takes the same arguments as search_listings.
+        
+        Raises:
+            SearchError: If the first page cannot be fetched
+        """
+        if not self.browser or not self.http:
             raise SearchError("Browser not initialized. Call start() first.")
         
         # Validate page_count
         if page_count < 1 or page_count > 20:
             page_count = max(1, min(20, page_count))
-            logger.warning(f"page_count clamped to valid range: {page_count}")
-        
-        # Build URL with price filter
-        price_path = ""
-        if min_price is not None or max_price is not None:
-            min_price_str = str(min_price) if min_price is not None else ""
-            max_price_str = str(max_price) if max_price is not None else ""
-            price_path = f"/preis:{min_price_str}:{max_price_str}"
-        
-        search_path = f"{price_path}/s-seite:{{page}}"
-        
-        # Build query parameters
-        params = {}
-        if query:
-            params['keywords'] = query
-        if location:
-            params['locationStr'] = location
-        if radius:
-            params['radius'] = radius
-        
-        search_url = self.base_url + search_path + ("?" + urlencode(params) if params else "")
+            logger.warning("page_count clamped to valid range: %s", page_count)
         
-        results = []
-        context = await self.browser.new_context(
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        search_url = _build_search_url_template(
+            self.base_url, query, location, radius, min_price, max_price
         )
-        page = await context.new_page()
+        
+        # Pages are independent, so start fetching all of them right away
+        tasks = [
+            asyncio.ensure_future(self._fetch_one_search_page(search_url.format(page=page_num)))
+            for page_num in range(1, page_count + 1)
+        ]
         
         try:
-            for page_num in range(1, page_count + 1):
-                current_url = search_url.format(page=page_num)
-                logger.info(f"Fetching page {page_num}: {current_url}")
-                
-                await page.goto(current_url, timeout=30000, wait_until="domcontentloaded")
-                # Wait for either the listing container or "no results" message
+            for page_num, task in enumerate(tasks, 1):
                 try:
-                    await page.wait_for_selector(".ad-listitem, .l-splitpage--no-results", timeout=10000)
+                    page_results = await task
                 except Exception as e:
-                    logger.warning(f"Selector wait failed: {e}, continuing anyway")
-                
-                page_results = await self._extract_listings_from_page(page)
-                results.extend(page_results)
+                    if page_num == 1:
+                        logger.error("Search failed: %s", e)
+                        raise SearchError(f"Failed to search listings: {e}")
+                    # Keep the pages we already have instead of failing the whole search
+                    logger.warning("Skipping search page %s: %s", page_num, e)
+                    continue
                 
                 if not page_results and page_num == 1:
                     logger.warning("No results found on first page")
-                    break
-                    
-            logger.info(f"Search completed: {len(results)} listings found")
-            return results
-            
-        except Exception as e:
-            logger.error(f"Search failed: {e}")
-            raise SearchError(f"Failed to search listings: {e}")
+                    return
+                
+                for listing in page_results:
+                    yield listing
         finally:
-            await page.close()
-            await context.close()
+            # Don't keep fetching pages nobody is going to read
+            for task in tasks:
+                task.cancel()
     
-    async def _extract_listings_from_page(self, page: Page) -> List[ListingSummary]:
-        """Extract listing data from a search results page."""
+    async def fetch_page(
+        self,
+        page_num: int,
+        query: Optional[str] = None,
+        location: Optional[str] = None,
+        radius: Optional[int] = None,
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None
+    ) -> List[ListingSummary]:
+        """
+        Fetch a single page of search results.
+        
+        Takes the same filters as search_listings. Useful for callers that
+        schedule pages themselves; concurrent calls share the client's
+        search concurrency limit.
+        
+        Raises:
+            SearchError: If the page could not be fetched
+        """
+        if not self.browser or not self.http:
+            raise SearchError("Browser not initialized. Call start() first.")
+        
+        search_url = _build_search_url_template(
+            self.base_url, query, location, radius, min_price, max_price
+        )
+        try:
+            return await self._fetch_one_search_page(search_url.format(page=page_num))
+        except Exception as e:
+            logger.error("Failed to fetch search page %s: %s", page_num, e)
+            raise SearchError(f"Failed to fetch search page {page_num}: {e}")
+    
+    async def _fetch_one_search_page(self, url: str) -> List[ListingSummary]:
+        """Fetch a single search results page, falling back to the browser if needed."""
+        async with self._search_semaphore:
+            logger.info("Fetching page: %s", url)
+            page_results = None
+            if self.http_first:
+                page_results = await self._fetch_search_page_http(url)
+                if page_results is None:
+                    logger.info("HTTP fetch did not return a results page, trying browser without JavaScript")
+            if page_results is None:
+                async with self._nojs_page() as page:
+                    page_results = await self._fetch_search_page_nojs(page, url)
+            if page_results is None:
+                logger.info("No results page without JavaScript, retrying with JavaScript enabled")
+                async with self._pooled_page() as page:
+                    page_results = await self._fetch_search_page_browser(page, url)
+            return page_results
+    
+    async def _fetch_search_page_http(self, url: str) -> Optional[List[ListingSummary]]:
+        """
+        Fetch and parse a search results page without a browser.
+        
+        Search result pages are server-rendered, so a plain GET is enough in
+        the common case. Returns None if the response doesn't look like a
+        results page (e.g. bot challenge), so the caller can use the browser.
+        """
+        http = self.http
+        assert http is not None, "start() creates the HTTP client"
         try:
-            items = await page.query_selector_all(".ad-listitem:not(.is-topad):not(.badge-hint-pro-small-srp)")
-            results = []
+            response = await http.get(url)
+        except httpx.HTTPError as e:
+            logger.warning("HTTP fetch failed: %s", e)
+            return None
+        
+        if response.status_code in _BLOCKED_STATUS_CODES:
+            logger.warning("HTTP fetch blocked with status %s", response.status_code)
+            return None
+        if response.status_code != 200:
+            logger.warning("HTTP fetch returned status %s", response.status_code)
+            return None
+        # Work on the raw body: the parser decodes UTF-8 itself, so the
+        # page is never copied into a Python str
+        if _CHALLENGE_MARKER in response.content:
+            logger.warning("HTTP fetch got a bot challenge page")
+            return None
+        
+        # Parse off the event loop so other page fetches keep making progress
+        return await asyncio.to_thread(self._parse_search_html, response.content)
+    
+    async def _fetch_search_page_nojs(self, page: Page, url: str) -> Optional[List[ListingSummary]]:
+        """
+        Fetch a search results page in the browser with JavaScript disabled.
+        
+        No scripts run, so the DOM is final once parsed and the HTML can go
+        through the same parser as the HTTP path. Returns None if it doesn't
+        look like a results page.
+        """
+        await page.goto(url, timeout=30000, wait_until="domcontentloaded")
+        html = await page.content()
+        return await asyncio.to_thread(self._parse_search_html, html)
+    
+    def _parse_search_html(self, html: Union[str, bytes]) -> Optional[List[ListingSummary]]:
+        """Parse search result HTML (str or UTF-8 bytes), or return None if it isn't a results page."""
+        tree = LexborHTMLParser(html)
+        if not tree.css_first(".ad-listitem, .l-splitpage--no-results"):
+            return None
+        
+        return self._extract_listings_from_html(tree)
+    
+    async def _fetch_search_page_browser(self, page: Page, url: str) -> List[ListingSummary]:
+        """Fetch a search results page with the browser (fallback path)."""
+        # Extraction script waits for the results itself, so return on commit
+        await page.goto(url, timeout=30000, wait_until="commit")
+        return await self._extract_listings_from_page(page)
+    
+    def _extract_listings_from_html(self, tree: LexborHTMLParser) -> List[ListingSummary]:
+        """Extract listing data from a parsed search results page."""
+        results = []
+        for article in tree.css(f"{_LISTING_ITEM_SELECTOR} article"):
+            data_adid = article.attributes.get("data-adid")
+            data_href = article.attributes.get("data-href")
+            if not data_adid or not data_href:
+                continue
             
-            for item in items:
-                article = await item.query_selector("article")
-                if not article:
-                    continue
-                
-                data_adid = await article.get_attribute("data-adid")
-                data_href = await article.get_attribute("data-href")
-                
-                # Extract title
-                title_element = await article.query_selector("h2.text-module-begin a.ellipsis")
-                title_text = await title_element.inner_text() if title_element else ""
-                
-                # Extract price
-                price_element = await article.query_selector("p.aditem-main--middle--price-shipping--price")
-                price_text = ""
-                if price_element:
-                    price_text = await price_element.inner_text()
-                    price_text = price_text.replace("€", "").replace("VB", "").replace(".", "").strip()
-                
-                # Extract description
-                desc_element = await article.query_selector("p.aditem-main--middle--description")
-                description_text = await desc_element.inner_text() if desc_element else ""
-                
-                if data_adid and data_href:
-                    full_url = f"{self.base_url}{data_href}"
-                    results.append(ListingSummary(
-                        adid=data_adid,
-                        url=full_url,
-                        title=title_text,
-                        price=price_text,
-                        description=description_text
-                    ))
+            title_element = article.css_first("h2.text-module-begin a.ellipsis")
+            # text(strip=True) strips every text node and glues them together,
+            # merging words split by inline tags; trim the whole text like innerText
+            title_text = title_element.text().strip() if title_element else ""
+            
+            price_element = article.css_first("p.aditem-main--middle--price-shipping--price")
+            price = self._parse_price(price_element.text()) if price_element else None
             
-            return results
+            desc_element = article.css_first("p.aditem-main--middle--description")
+            description_text = desc_element.text().strip() if desc_element else ""
             
+            results.append(ListingSummary(
+                adid=data_adid,
+                url=f"{self.base_url}{data_href}",
+                title=title_text,
+                price=price,
+                description=description_text
+            ))
+        
+        return results
+    
+    async def _extract_listings_from_page(self, page: Page) -> List[ListingSummary]:
+        """
+        Extract listing data from a search results page.
+        
+        An empty list means the site showed an empty results page.
+        
+        Raises:
+            SearchError: If the page isn't a results page or can't be read
+        """
+        try:
+            # Single evaluate instead of several CDP round-trips per listing
+            rows = await page.evaluate(_EXTRACT_LISTINGS_JS, _LISTING_ITEM_SELECTOR)
         except Exception as e:
-            logger.error(f"Failed to extract listings from page: {e}")
-            return []
+            logger.error("Failed to extract listings from page: %s", e)
+            raise SearchError(f"Failed to extract listings: {e}")
+        if rows is None:
+            raise SearchError("Search results page did not load")
+        
+        results = []
+        for row in rows:
+            if row["adid"] and row["href"]:
+                results.append(ListingSummary(
+                    adid=row["adid"],
+                    url=f"{self.base_url}{row['href']}",
+                    title=row["title"],
+                    price=self._parse_price(row["price"]),
+                    description=row["description"]
+                ))
+        
+        return results
     
     async def get_listing_details(self, listing_id: str) -> ListingDetails:
         """
@@ -204,140 +706,117 @@ async def get_listing_details(self, listing_id: str) -> ListingDetails:
         if not self.browser:
             raise DetailFetchError("Browser not initialized. Call start() first.")
         
+        cached = self._detail_cache.get(listing_id)
+        if cached is not None:
+            logger.info("Returning cached details for listing %s", listing_id)
+            return cached
+        
+        task = self._inflight_details.get(listing_id)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_listing_details(listing_id))
+            self._inflight_details[listing_id] = task
+            task.add_done_callback(lambda _: self._inflight_details.pop(listing_id, None))
+        else:
+            logger.info("Joining in-flight fetch for listing %s", listing_id)
+        
+        # Shield so one caller being cancelled doesn't cancel the fetch for the others
+        return await asyncio.shield(task)
+    
+    async def _fetch_listing_details(self, listing_id: str) -> ListingDetails:
+        """Navigate to a listing and extract its details."""
         url = f"{self.base_url}/s-anzeige/{listing_id}"
-        context = await self.browser.new_context(
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        )
-        page = await context.new_page()
         
         try:
-            logger.info(f"Fetching details for listing {listing_id}")
-            await page.goto(url, timeout=30000, wait_until="domcontentloaded")
-            
-            # Wait for view counter (optional, may not appear)
-            try:
-                await page.wait_for_selector("#viewad-cntr-num", state="visible", timeout=2500)
-            except:
-                logger.debug("View counter did not appear")
-            
-            # Extract all details
-            details = await self._extract_listing_details(page)
-            logger.info(f"Successfully fetched details for {listing_id}")
+            async with self._pooled_page() as page:
+                logger.info("Fetching details for listing %s", listing_id)
+                # Extraction script waits for the DOM and view counter itself
+                await page.goto(url, timeout=30000, wait_until="commit")
+                details = await self._extract_listing_details(page)
+            logger.info("Successfully fetched details for %s", listing_id)
+            self._detail_cache.set(listing_id, details)
             return details
             
         except Exception as e:
-            logger.error(f"Failed to fetch listing details: {e}")
+            logger.error("Failed to fetch listing details: %s", e)
             raise DetailFetchError(f"Failed to fetch listing {listing_id}: {e}")
-        finally:
-            await page.close()
-            await context.close()
+    
+    async def get_listings_details(
+        self,
+        listing_ids: List[str],
+        concurrency: int = CONTEXT_POOL_SIZE
+    ) -> List[Union[ListingDetails, BaseException]]:
+        """
+        Fetch details for several listings concurrently.
+        
+        Args:
+            listing_ids: Ad IDs to fetch
+            concurrency: Maximum number of detail pages loaded at the same time
+            
+        Returns:
+            One entry per ID, in input order: the ListingDetails, or the
+            exception (usually DetailFetchError) if that listing could not
+            be fetched
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def fetch_one(listing_id: str) -> ListingDetails:
+            async with semaphore:
+                return await self.get_listing_details(listing_id)
+        
+        return await asyncio.gather(
+            *(fetch_one(listing_id) for listing_id in listing_ids),
+            return_exceptions=True
+        )
     
     async def _extract_listing_details(self, page: Page) -> ListingDetails:
         """Extract complete listing information from detail page."""
-        # Helper functions for extraction
-        async def get_text(selector: str, default: str = "") -> str:
-            element = await page.query_selector(selector)
-            if element:
-                text = await element.inner_text()
-                return text.strip()
-            return default
-        
-        async def get_texts(selector: str) -> List[str]:
-            elements = await page.query_selector_all(selector)
-            texts = []
-            for elem in elements:
-                text = await elem.inner_text()
-                if text.strip():
-                    texts.append(text.strip())
-            return texts
+        # All fields are read in one evaluate to avoid a CDP round-trip per element
+        data = await page.evaluate(_EXTRACT_DETAILS_JS)
         
         # Extract basic info
-        ad_id = await get_text("#viewad-ad-id-box > ul > li:nth-child(2)", "[ERROR] ID not found")
-        categories = await get_texts(".breadcrump-link")
-        title = await get_text("#viewad-title", "[ERROR] Title not found")
+        ad_id = data["id"] or "[ERROR] ID not found"
+        categories = data["categories"]
+        title = data["title"] or "[ERROR] Title not found"
         
         # Determine status
         status = "active"
-        title_element = await page.query_selector("#viewad-title")
-        if title_element:
-            title_text = await title_element.inner_text()
-            if "Verkauft" in title_text:
-                status = "sold"
-            elif "Reserviert •" in title_text:
-                status = "reserved"
-            elif "Gelöscht •" in title_text:
-                status = "deleted"
-        
-        if await page.query_selector(".badge-sold"):
+        if "Verkauft" in title:
+            status = "sold"
+        elif "Reserviert •" in title:
+            status = "reserved"
+        elif "Gelöscht •" in title:
+            status = "deleted"
+        
+        if data["sold_badge"]:
             status = "sold"
         
         # Clean title
         if " • " in title:
             title = title.split(" • ")[-1].strip()
         
-        # Extract price
-        price_text = await get_text("#viewad-price")
-        price = self._parse_price(price_text)
-        
-        # Extract views
-        views = await get_text("#viewad-cntr-num", "0")
+        price = self._parse_price(data["price"])
+        views = data["views"] or "0"
         
-        # Extract description
-        description = await get_text("#viewad-description-text")
+        # Clean description whitespace
+        description = data["description"]
         if description:
-            description = re.sub(r'[ \t]+', ' ', description).strip()
-            description = re.sub(r'\n+', '\n', description)
-        
-        # Extract images
-        images = []
-        image_elements = await page.query_selector_all("#viewad-image img")
-        for img in image_elements:
-            src = await img.get_attribute("src")
-            if src:
-                images.append(src)
+            description = _SPACES_PATTERN.sub(' ', description).strip()
+            description = _NEWLINES_PATTERN.sub('\n', description)
         
         # Extract shipping info
         shipping = None
-        shipping_text = await get_text(".boxedarticle--details--shipping")
+        shipping_text = data["shipping"]
         if shipping_text:
             if "Nur Abholung" in shipping_text:
                 shipping = "pickup"
             elif "Versand" in shipping_text:
                 shipping = "shipping"
         
-        # Extract location
-        location_text = await get_text("#viewad-locality")
-        location = {"raw": location_text} if location_text else {}
-        
-        # Extract seller details
-        seller = {}
-        seller_name = await get_text(".userprofile--name")
-        if seller_name:
-            seller["name"] = seller_name
-        
-        # Extract details section
-        details = {}
-        if await page.query_selector("#viewad-details"):
-            detail_items = await page.query_selector_all("#viewad-details .addetailslist--detail")
-            for item in detail_items:
-                label_elem = await item.query_selector(".addetailslist--detail--label")
-                value_elem = await item.query_selector(".addetailslist--detail--value")
-                if label_elem and value_elem:
-                    label = (await label_elem.inner_text()).strip()
-                    value = (await value_elem.inner_text()).strip()
-                    details[label] = value
-        
-        # Extract features
-        features = {}
-        if await page.query_selector("#viewad-configuration"):
-            feature_items = await page.query_selector_all("#viewad-configuration .addetailslist--detail")
-            for item in feature_items:
-                label_elem = await item.query_selector(".addetailslist--detail--label")
-                value_elem = await item.query_selector(".addetailslist--detail--value")
-                if label_elem and value_elem:
-                    label = (await label_elem.inner_text()).strip()
-                    value = (await value_elem.inner_text()).strip()
-                    features[label] = value
+        location: Location = {"raw": data["location"]} if data["location"] else {}
+        
+        seller: Seller = {}
+        if data["seller_name"]:
+            seller["name"] = data["seller_name"]
         
         return ListingDetails(
             id=ad_id,
@@ -349,20 +828,64 @@ async def get_texts(selector: str) -> List[str]:
             location=location,
             views=views,
             description=description,
-            images=images,
-            details=details,
-            features=features,
+            images=data["images"],
+            details=data["details"],
+            features=data["features"],
             seller=seller,
             extra_info={}
         )
     
-    def _parse_price(self, price_text: str) -> Optional[str]:
-        """Parse price from text, handling various formats."""
+    @staticmethod
+    def _parse_price(price_text: str) -> Optional[int]:
+        """
+        Parse a price label like "1.299 € VB" into whole euros.
+        
+        Free items ("Zu verschenken") are 0; None means no price was given.
+        """
         if not price_text:
             return None
         
-        # Remove common non-numeric characters
-        cleaned = price_text.replace("€", "").replace("VB", "").replace(".", "").strip()
-        
-        # Return cleaned price or None if it's empty
-        return cleaned if cleaned else None
+        # Cents after a decimal comma ("12,50 €") are dropped
+        match = _PRICE_PATTERN.search(price_text)
+        if match:
+            return int(match.group().translate(_THOUSANDS_SEPARATOR_TABLE))
+        return 0 if "verschenken" in price_text.lower() else None
+
+
+# Process-wide client shared by the MCP tools, see get_client()
+_shared_client: Optional[KleinanzeigenClient] = None
+_shared_client_lock = asyncio.Lock()
+
+
+async def get_client() -> KleinanzeigenClient:
+    """
+    Return the process-wide client, starting it on first use.
+    
+    Starting Playwright and the browser takes a second or more, so the MCP
+    tools share one long-lived client instead of creating one per call. If
+    the browser has crashed or the CDP connection dropped, the client is
+    replaced with a fresh one.
+    """
+    global _shared_client
+    if _shared_client is not None and _shared_client.is_connected():
+        return _shared_client
+    async with _shared_client_lock:
+        if _shared_client is not None and not _shared_client.is_connected():
+            logger.warning("Shared browser disconnected, restarting client")
+            await _shared_client.close()
+            _shared_client = None
+        if _shared_client is None:
+            client = KleinanzeigenClient()
+            await client.start()
+            _shared_client = client
+    return _shared_client
+
+
+async def close_client():
+    """Close the process-wide client if it was started, and the shared browser with it."""
+    global _shared_client
+    async with _shared_client_lock:
+        if _shared_client is not None:
+            await _shared_client.close()
+            _shared_client = None
+        await KleinanzeigenClient.shutdown()
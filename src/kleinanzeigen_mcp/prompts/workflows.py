@@ -173,7 +173,7 @@ def _find_deals_impl(item_type: str, max_budget: int, location: str = "Germany")
 **Your Task:**
 1. Use search_listings to find available {item_type} items under {max_budget}€ in {location}
 2. Sort results mentally by value (price vs. features/condition)
-3. For the top 3-5 most promising listings, use get_listing_details to get full information
+3. For the top 3-5 most promising listings, use get_listings_details_bulk (one call with all their IDs) to get full information
 4. Compare and present:
    - Price comparison
    - Condition analysis
@@ -199,7 +199,7 @@ def _compare_listings_impl(listing_ids: str) -> str:
 {', '.join(ids)}
 
 **Your Task:**
-1. Use get_listing_details for each listing ID
+1. Use get_listings_details_bulk once with all listing IDs (they are fetched in parallel)
 2. Create a comparison table with:
    - Price
    - Condition/Status
@@ -8,22 +8,56 @@
 - STDIO: For local clients (Claude Desktop, MCP Toolkit)
 - SSE: For remote server deployment with HTTP/SSE
 """
+import asyncio
+import atexit
+import functools
+import hashlib
 import logging
+import logging.handlers
+import queue
 import sys
 import os
-from typing import Literal
+from contextlib import asynccontextmanager
+from types import MappingProxyType
+from typing import Any, Literal
 
-# Configure logging to stderr only (CRITICAL for STDIO mode)
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[logging.StreamHandler(sys.stderr)]  # stderr only!
-)
+import orjson
+from starlette.responses import Response
+
+
+def configure_logging() -> None:
+    """
+    Send log records to stderr from a background thread.
+    
+    Handlers only enqueue records, so logging never blocks the event loop
+    on a stderr write. Output goes to stderr only (CRITICAL for STDIO mode).
+    """
+    root = logging.getLogger()
+    if any(isinstance(h, logging.handlers.QueueHandler) for h in root.handlers):
+        # Already configured, e.g. when run via "python -m kleinanzeigen_mcp.server"
+        return
+    
+    stream_handler = logging.StreamHandler(sys.stderr)  # stderr only!
+    stream_handler.setFormatter(
+        logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    )
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root.setLevel(os.environ.get("LOG_LEVEL", "INFO").upper())
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    # Flush whatever is still queued when the process exits
+    atexit.register(listener.stop)
+
+
+configure_logging()
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
 def get_transport_mode() -> Literal["stdio", "sse"]:
-    """Get transport mode from environment variable."""
+    """Get transport mode from environment variable (read once per process)."""
     mode = os.environ.get("TRANSPORT_MODE", "stdio").lower()
     if mode not in ["stdio", "sse"]:
         logger.warning(f"Invalid TRANSPORT_MODE '{mode}', defaulting to 'stdio'")
@@ -31,11 +65,48 @@ def get_transport_mode() -> Literal["stdio", "sse"]:
     return mode  # type: ignore
 
 
+def install_uvloop() -> bool:
+    """Use uvloop as the asyncio event loop if it is available (not on Windows)."""
+    if sys.platform == "win32":
+        return False
+    try:
+        import uvloop
+    except ImportError:
+        logger.info("uvloop not installed, using default asyncio event loop")
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+@asynccontextmanager
+async def client_lifespan(_app):
+    """Start the shared scraping client with the server and close it on shutdown."""
+    from .client import get_client, close_client
+    
+    await get_client()
+    try:
+        yield
+    finally:
+        await close_client()
+
+
+class ORJSONResponse(Response):
+    """JSON response rendered with orjson instead of the stdlib encoder."""
+    
+    media_type = "application/json"
+    
+    def render(self, content: Any) -> bytes:
+        # Pre-encoded bodies (see create_sse_server) are sent as-is
+        if isinstance(content, bytes):
+            return content
+        return orjson.dumps(content)
+
+
 def create_stdio_server():
     """Create MCP server for STDIO transport (local clients)."""
     from mcp.server.fastmcp import FastMCP
     
-    mcp = FastMCP(name="ebay-kleinanzeigen-search")
+    mcp = FastMCP(name="ebay-kleinanzeigen-search", lifespan=client_lifespan)
     
     # Register all tools and prompts
     from .tools import register_listing_tools
@@ -45,19 +116,211 @@ def create_stdio_server():
     register_prompts(mcp)
     
     logger.info("Kleinanzeigen MCP Server initialized (STDIO mode)")
-    logger.info("Available tools: search_listings, get_listing_details")
+    logger.info("Available tools: search_listings, get_listing_details, get_listings_details_bulk")
     logger.info("Available prompts: find_deals, compare_listings, monitor_search")
     
     return mcp
 
 
+# Static documents served by the SSE app, built once at import
+_HEALTH_STATUS = MappingProxyType({
+    "status": "ok",
+    "server": "ebay-kleinanzeigen-search",
+    "version": "1.0.0",
+    "transport": "sse",
+    "endpoints": {
+        "health": "/",
+        "sse": "/sse",
+        "messages": "/messages",
+        "openapi": "/openapi.json"
+    }
+})
+
+_OPENAPI_SPEC = MappingProxyType({
+    "openapi": "3.1.0",
+    "info": {
+        "title": "eBay Kleinanzeigen Search MCP Server",
+        "description": "Model Context Protocol server for searching eBay Kleinanzeigen listings",
+        "version": "1.0.0",
+        "contact": {
+            "name": "MCP Server",
+            "url": "https://github.com/Sprayer115/ebay-kleinanzeigen-api-mcp"
+        }
+    },
+    "servers": [
+        {
+            "url": "/",
+            "description": "MCP SSE Server"
+        }
+    ],
+    "paths": {
+        "/": {
+            "get": {
+                "summary": "Health check",
+                "operationId": "health",
+                "responses": {
+                    "200": {
+                        "description": "Server status",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "status": {"type": "string"},
+                                        "server": {"type": "string"},
+                                        "version": {"type": "string"}
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        },
+        "/sse": {
+            "get": {
+                "summary": "Server-Sent Events stream",
+                "operationId": "sse_stream",
+                "responses": {
+                    "200": {
+                        "description": "SSE stream",
+                        "content": {
+                            "text/event-stream": {}
+                        }
+                    }
+                }
+            }
+        },
+        "/messages": {
+            "post": {
+                "summary": "Send MCP messages",
+                "operationId": "send_message",
+                "requestBody": {
+                    "required": True,
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "object",
+                                "properties": {
+                                    "method": {"type": "string"},
+                                    "params": {"type": "object"}
+                                }
+                            }
+                        }
+                    }
+                },
+                "responses": {
+                    "200": {
+                        "description": "Message received"
+                    }
+                }
+            }
+        }
+    },
+    "components": {
+        "schemas": {
+            "SearchListingsRequest": {
+                "type": "object",
+                "properties": {
+                    "query": {
+                        "type": "string",
+                        "description": "Suchbegriff für eBay Kleinanzeigen"
+                    },
+                    "location": {
+                        "type": "string",
+                        "description": "Optional: Standort für die Suche (z.B. 'Berlin', 'München')"
+                    },
+                    "category": {
+                        "type": "string",
+                        "description": "Optional: Kategorie (z.B. 'Elektronik', 'Auto')"
+                    },
+                    "max_results": {
+                        "type": "integer",
+                        "default": 20,
+                        "description": "Maximale Anzahl der Ergebnisse"
+                    }
+                },
+                "required": ["query"]
+            },
+            "GetListingDetailsRequest": {
+                "type": "object",
+                "properties": {
+                    "listing_url": {
+                        "type": "string",
+                        "description": "URL des Inserats auf eBay Kleinanzeigen"
+                    }
+                },
+                "required": ["listing_url"]
+            },
+            "GetListingsDetailsBulkRequest": {
+                "type": "object",
+                "properties": {
+                    "listing_ids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "IDs der Inserate, die parallel abgerufen werden"
+                    }
+                },
+                "required": ["listing_ids"]
+            }
+        }
+    },
+    "x-mcp": {
+        "protocol_version": "2025-06-18",
+        "transport": "sse",
+        "tools": [
+            {
+                "name": "search_listings",
+                "description": "Suche nach Inseraten auf eBay Kleinanzeigen",
+                "inputSchema": {
+                    "$ref": "#/components/schemas/SearchListingsRequest"
+                }
+            },
+            {
+                "name": "get_listing_details",
+                "description": "Hole detaillierte Informationen zu einem spezifischen Inserat",
+                "inputSchema": {
+                    "$ref": "#/components/schemas/GetListingDetailsRequest"
+                }
+            },
+            {
+                "name": "get_listings_details_bulk",
+                "description": "Hole Details zu mehreren Inseraten parallel",
+                "inputSchema": {
+                    "$ref": "#/components/schemas/GetListingsDetailsBulkRequest"
+                }
+            }
+        ],
+        "prompts": [
+            {
+                "name": "find_deals",
+                "description": "Finde die besten Angebote basierend auf Suchkriterien"
+            },
+            {
+                "name": "compare_listings",
+                "description": "Vergleiche mehrere ähnliche Inserate"
+            },
+            {
+                "name": "monitor_search",
+                "description": "Überwache eine Suche auf neue Angebote"
+            }
+        ]
+    }
+})
+
+
 def create_sse_server():
-    """Create MCP server for SSE transport (remote server deployment)."""
+    """
+    Create MCP server for SSE transport (remote server deployment).
+    
+    Set CHROMIUM_CDP_URL to reuse a long-running headless Chromium sidecar
+    (e.g. a browserless container or chromium --remote-debugging-port)
+    instead of launching a browser inside this process.
+    """
     from mcp.server import Server
     from mcp.server.sse import SseServerTransport
     from starlette.applications import Starlette
     from starlette.routing import Route
-    import uvicorn
     
     # Create MCP server instance
     server = Server(name="ebay-kleinanzeigen-search")
@@ -70,7 +333,7 @@ def create_sse_server():
     register_prompts_manual(server)
     
     logger.info("Kleinanzeigen MCP Server initialized (SSE mode)")
-    logger.info("Available tools: search_listings, get_listing_details")
+    logger.info("Available tools: search_listings, get_listing_details, get_listings_details_bulk")
     logger.info("Available prompts: find_deals, compare_listings, monitor_search")
     
     # Create SSE transport
@@ -87,182 +350,28 @@ async def handle_sse(request):
     async def handle_messages(request):
         await sse.handle_post_message(request.scope, request.receive, request._send)
     
+    # Both documents are static, so serialize them once instead of per request
+    health_body = orjson.dumps(dict(_HEALTH_STATUS))
+    openapi_body = orjson.dumps(dict(_OPENAPI_SPEC))
+    
     async def handle_health(request):
         """Health check endpoint for monitoring and OpenWebUI."""
-        from starlette.responses import JSONResponse
-        return JSONResponse({
-            "status": "ok",
-            "server": "ebay-kleinanzeigen-search",
-            "version": "1.0.0",
-            "transport": "sse",
-            "endpoints": {
-                "health": "/",
-                "sse": "/sse",
-                "messages": "/messages",
-                "openapi": "/openapi.json"
-            }
-        })
+        return ORJSONResponse(health_body)
+    
+    # The spec only changes with a deploy, so let clients revalidate cheaply
+    openapi_etag = f'"{hashlib.blake2b(openapi_body, digest_size=8).hexdigest()}"'
+    openapi_headers = {"ETag": openapi_etag, "Cache-Control": "public, max-age=300"}
     
     async def handle_openapi(request):
         """OpenAPI specification endpoint for tool discovery."""
-        from starlette.responses import JSONResponse
-        return JSONResponse({
-            "openapi": "3.1.0",
-            "info": {
-                "title": "eBay Kleinanzeigen Search MCP Server",
-                "description": "Model Context Protocol server for searching eBay Kleinanzeigen listings",
-                "version": "1.0.0",
-                "contact": {
-                    "name": "MCP Server",
-                    "url": "https://github.com/Sprayer115/ebay-kleinanzeigen-api-mcp"
-                }
-            },
-            "servers": [
-                {
-                    "url": "/",
-                    "description": "MCP SSE Server"
-                }
-            ],
-            "paths": {
-                "/": {
-                    "get": {
-                        "summary": "Health check",
-                        "operationId": "health",
-                        "responses": {
-                            "200": {
-                                "description": "Server status",
-                                "content": {
-                                    "application/json": {
-                                        "schema": {
-                                            "type": "object",
-                                            "properties": {
-                                                "status": {"type": "string"},
-                                                "server": {"type": "string"},
-                                                "version": {"type": "string"}
-                                            }
-                                        }
-                                    }
-                                }
-                            }
-                        }
-                    }
-                },
-                "/sse": {
-                    "get": {
-                        "summary": "Server-Sent Events stream",
-                        "operationId": "sse_stream",
-                        "responses": {
-                            "200": {
-                                "description": "SSE stream",
-                                "content": {
-                                    "text/event-stream": {}
-                                }
-                            }
-                        }
-                    }
-                },
-                "/messages": {
-                    "post": {
-                        "summary": "Send MCP messages",
-                        "operationId": "send_message",
-                        "requestBody": {
-                            "required": True,
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object",
-                                        "properties": {
-                                            "method": {"type": "string"},
-                                            "params": {"type": "object"}
-                                        }
-                                    }
-                                }
-                            }
-                        },
-                        "responses": {
-                            "200": {
-                                "description": "Message received"
-                            }
-                        }
-                    }
-                }
-            },
-            "components": {
-                "schemas": {
-                    "SearchListingsRequest": {
-                        "type": "object",
-                        "properties": {
-                            "query": {
-                                "type": "string",
-                                "description": "Suchbegriff für eBay Kleinanzeigen"
-                            },
-                            "location": {
-                                "type": "string",
-                                "description": "Optional: Standort für die Suche (z.B. 'Berlin', 'München')"
-                            },
-                            "category": {
-                                "type": "string",
-                                "description": "Optional: Kategorie (z.B. 'Elektronik', 'Auto')"
-                            },
-                            "max_results": {
-                                "type": "integer",
-                                "default": 20,
-                                "description": "Maximale Anzahl der Ergebnisse"
-                            }
-                        },
-                        "required": ["query"]
-                    },
-                    "GetListingDetailsRequest": {
-                        "type": "object",
-                        "properties": {
-                            "listing_url": {
-                                "type": "string",
-                                "description": "URL des Inserats auf eBay Kleinanzeigen"
-                            }
-                        },
-                        "required": ["listing_url"]
-                    }
-                }
-            },
-            "x-mcp": {
-                "protocol_version": "2025-06-18",
-                "transport": "sse",
-                "tools": [
-                    {
-                        "name": "search_listings",
-                        "description": "Suche nach Inseraten auf eBay Kleinanzeigen",
-                        "inputSchema": {
-                            "$ref": "#/components/schemas/SearchListingsRequest"
-                        }
-                    },
-                    {
-                        "name": "get_listing_details",
-                        "description": "Hole detaillierte Informationen zu einem spezifischen Inserat",
-                        "inputSchema": {
-                            "$ref": "#/components/schemas/GetListingDetailsRequest"
-                        }
-                    }
-                ],
-                "prompts": [
-                    {
-                        "name": "find_deals",
-                        "description": "Finde die besten Angebote basierend auf Suchkriterien"
-                    },
-                    {
-                        "name": "compare_listings",
-                        "description": "Vergleiche mehrere ähnliche Inserate"
-                    },
-                    {
-                        "name": "monitor_search",
-                        "description": "Überwache eine Suche auf neue Angebote"
-                    }
-                ]
-            }
-        })
+        if openapi_etag in request.headers.get("if-none-match", ""):
+            return Response(status_code=304, headers=openapi_headers)
+        return ORJSONResponse(openapi_body, headers=openapi_headers)
     
-    # Create Starlette app
+    # Create Starlette app (lifespan runs once per process, not per SSE session)
     app = Starlette(
         debug=True,
+        lifespan=client_lifespan,
         routes=[
             Route("/", endpoint=handle_health, methods=["GET"]),
             Route("/openapi.json", endpoint=handle_openapi, methods=["GET"]),
@@ -284,6 +393,7 @@ def main():
     """Main entry point for the MCP server."""
     transport_mode = get_transport_mode()
     logger.info(f"Starting Kleinanzeigen MCP Server (transport: {transport_mode})...")
+    use_uvloop = install_uvloop()
     
     if transport_mode == "stdio":
         # STDIO mode: Standard MCP server for local clients
@@ -293,7 +403,16 @@ def main():
         # SSE mode: HTTP/SSE server for remote deployment
         import uvicorn
         app, host, port = create_sse_server()
-        uvicorn.run(app, host=host, port=port)
+        uvicorn.run(
+            app,
+            host=host,
+            port=port,
+            loop="uvloop" if use_uvloop else "asyncio",
+            http="httptools",
+            lifespan="on",
+            access_log=False,
+            log_config=None  # keep the queue-based logging from configure_logging()
+        )
 
 
 if __name__ == "__main__":
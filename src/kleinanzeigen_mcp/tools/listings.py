@@ -1,18 +1,27 @@
 """Tool implementations for Kleinanzeigen MCP Server."""
+import asyncio
 import logging
-from typing import Optional, List, Union
-from mcp.server.fastmcp import FastMCP
+import os
+import re
+from typing import Annotated, Any, Awaitable, Callable, Dict, Hashable, Iterator, Optional, List, Tuple, TypeVar, Union
+from mcp.server.fastmcp import Context, FastMCP
+from pydantic import Field
 
-from ..client import KleinanzeigenClient
+from ..cache import TTLCache
+from ..client import get_client
+from ..types import ListingDetails
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 def register_listing_tools(mcp: FastMCP):
     """Register all listing-related MCP tools (FastMCP mode)."""
     
     @mcp.tool()
     async def search_listings(
+        ctx: Context,
         query: Optional[str] = None,
         location: Optional[str] = None,
         radius: Optional[int] = None,
@@ -45,7 +54,14 @@ async def search_listings(
             - Mehrere Seiten: query="gaming pc", page_count=3
             - Alternative Suche: query="heimkino boxen", location="79206"
         """
-        return await _search_listings_impl(query, location, radius, min_price, max_price, page_count)
+        async def report_listing(idx: int, block: str) -> None:
+            # Lets clients that sent a progress token show results early
+            await ctx.report_progress(idx, message=block)
+        
+        return await _search_listings_impl(
+            query, location, radius, min_price, max_price, page_count,
+            on_listing=report_listing
+        )
     
     @mcp.tool()
     async def get_listing_details(listing_id: str) -> str:
@@ -76,7 +92,29 @@ async def get_listing_details(listing_id: str) -> str:
         """
         return await _get_listing_details_impl(listing_id)
     
-    logger.info("Registered listing tools: search_listings, get_listing_details")
+    @mcp.tool()
+    async def get_listings_details_bulk(
+        listing_ids: Annotated[List[str], Field(max_length=MAX_BULK_LISTINGS)]
+    ) -> str:
+        """
+        Hole vollständige Details zu mehreren eBay Kleinanzeigen Inseraten auf einmal.
+        
+        Die Inserate werden parallel abgerufen. Nutze dieses Tool statt mehrerer
+        get_listing_details Aufrufe, z.B. um Inserate zu vergleichen.
+        
+        Args:
+            listing_ids: Liste von Inserat-IDs aus den Suchergebnissen, höchstens 20 (z.B. ["2937345678", "2937345679"])
+        
+        Returns:
+            Formatierte Details für jedes Inserat (wie get_listing_details),
+            in der Reihenfolge der übergebenen IDs. Fehler werden pro Inserat gemeldet.
+        
+        Beispiele:
+            - Vergleich: listing_ids=["2937345678", "2937345679", "2937345680"]
+        """
+        return await _get_listings_details_bulk_impl(listing_ids)
+    
+    logger.debug("Registered listing tools: search_listings, get_listing_details, get_listings_details_bulk")
 
 
 def register_listing_tools_manual(server):
@@ -84,88 +122,263 @@ def register_listing_tools_manual(server):
     from mcp.types import Tool
     from mcp import types
     
-    @server.list_tools()
-    async def list_tools() -> list[Tool]:
-        return [
-            Tool(
-                name="search_listings",
-                description="""Durchsuche eBay Kleinanzeigen (kleinanzeigen.de) nach Artikeln mit Filtern.
+    # Tool definitions never change, so build them once at registration
+    tools: list[Tool] = [
+        Tool(
+            name="search_listings",
+            description="""Durchsuche eBay Kleinanzeigen (kleinanzeigen.de) nach Artikeln mit Filtern.
         
 WICHTIG: Dies ist dein einziger Zugriff auf eBay Kleinanzeigen / kleinanzeigen.de!
 Nutze dieses Tool für ALLE Suchanfragen nach lokalen Angeboten, gebrauchten Artikeln,
 oder Kleinanzeigen in Deutschland.""",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": "Suchbegriffe für den Artikel (z.B. 'stereo lautsprecher', 'heimkino', 'fahrrad', 'laptop')"
-                        },
-                        "location": {
-                            "type": "string",
-                            "description": "Postleitzahl oder Ort (z.B. '78464', 'Konstanz', '79206', 'Berlin')"
-                        },
-                        "radius": {
-                            "type": "integer",
-                            "description": "Suchradius in Kilometern um den Standort (z.B. 5, 10, 20, 50)"
-                        },
-                        "min_price": {
-                            "type": "integer",
-                            "description": "Mindestpreis in EUR (z.B. 50)"
-                        },
-                        "max_price": {
-                            "type": "integer",
-                            "description": "Höchstpreis in EUR (z.B. 500)"
-                        },
-                        "page_count": {
-                            "type": "integer",
-                            "description": "Anzahl der Ergebnisseiten (1-20, Standard: 1)",
-                            "default": 1
-                        }
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "query": {
+                        "type": "string",
+                        "description": "Suchbegriffe für den Artikel (z.B. 'stereo lautsprecher', 'heimkino', 'fahrrad', 'laptop')"
+                    },
+                    "location": {
+                        "type": "string",
+                        "description": "Postleitzahl oder Ort (z.B. '78464', 'Konstanz', '79206', 'Berlin')"
+                    },
+                    "radius": {
+                        "type": "integer",
+                        "description": "Suchradius in Kilometern um den Standort (z.B. 5, 10, 20, 50)"
+                    },
+                    "min_price": {
+                        "type": "integer",
+                        "description": "Mindestpreis in EUR (z.B. 50)"
+                    },
+                    "max_price": {
+                        "type": "integer",
+                        "description": "Höchstpreis in EUR (z.B. 500)"
+                    },
+                    "page_count": {
+                        "type": "integer",
+                        "description": "Anzahl der Ergebnisseiten (1-20, Standard: 1)",
+                        "default": 1
                     }
                 }
-            ),
-            Tool(
-                name="get_listing_details",
-                description="""Hole vollständige Details zu einem eBay Kleinanzeigen Inserat.
+            }
+        ),
+        Tool(
+            name="get_listing_details",
+            description="""Hole vollständige Details zu einem eBay Kleinanzeigen Inserat.
         
 Nutze dieses Tool nach search_listings, um alle Informationen zu einem
 bestimmten Artikel zu erhalten: komplette Beschreibung, alle Bilder,
 Verkäufer-Info und technische Details.""",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "listing_id": {
-                            "type": "string",
-                            "description": "Die eindeutige Inserat-ID aus den Suchergebnissen (z.B. '2937345678')"
-                        }
-                    },
-                    "required": ["listing_id"]
-                }
-            )
-        ]
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "listing_id": {
+                        "type": "string",
+                        "description": "Die eindeutige Inserat-ID aus den Suchergebnissen (z.B. '2937345678')"
+                    }
+                },
+                "required": ["listing_id"]
+            }
+        ),
+        Tool(
+            name="get_listings_details_bulk",
+            description="""Hole vollständige Details zu mehreren eBay Kleinanzeigen Inseraten auf einmal.
+        
+Die Inserate werden parallel abgerufen. Nutze dieses Tool statt mehrerer
+get_listing_details Aufrufe, z.B. um Inserate zu vergleichen.""",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "listing_ids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Liste von Inserat-IDs aus den Suchergebnissen, höchstens 20 (z.B. ['2937345678', '2937345679'])",
+                        "maxItems": MAX_BULK_LISTINGS
+                    }
+                },
+                "required": ["listing_ids"]
+            }
+        )
+    ]
+    
+    @server.list_tools()
+    async def list_tools() -> list[Tool]:
+        return tools
+    
+    # Adapters from raw tool arguments to the shared implementations
+    handlers = {
+        # Search results go out as one text item per listing
+        "search_listings": lambda arguments: _search_listings_chunks(
+            query=arguments.get("query"),
+            location=arguments.get("location"),
+            radius=arguments.get("radius"),
+            min_price=arguments.get("min_price"),
+            max_price=arguments.get("max_price"),
+            page_count=arguments.get("page_count", 1)
+        ),
+        "get_listing_details": lambda arguments: _get_listing_details_impl(
+            listing_id=arguments["listing_id"]
+        ),
+        "get_listings_details_bulk": lambda arguments: _get_listings_details_bulk_impl(
+            listing_ids=arguments["listing_ids"]
+        ),
+    }
     
     @server.call_tool()
     async def call_tool(name: str, arguments: dict) -> list[types.TextContent]:
-        if name == "search_listings":
-            result = await _search_listings_impl(
-                query=arguments.get("query"),
-                location=arguments.get("location"),
-                radius=arguments.get("radius"),
-                min_price=arguments.get("min_price"),
-                max_price=arguments.get("max_price"),
-                page_count=arguments.get("page_count", 1)
-            )
-        elif name == "get_listing_details":
-            result = await _get_listing_details_impl(
-                listing_id=arguments["listing_id"]
-            )
-        else:
+        handler = handlers.get(name)
+        if handler is None:
             raise ValueError(f"Unknown tool: {name}")
+        result = await handler(arguments)
         
-        return [types.TextContent(type="text", text=result)]
+        if isinstance(result, str):
+            return [types.TextContent(type="text", text=result)]
+        return [types.TextContent(type="text", text=chunk) for chunk in result]
+    
+    logger.debug("Registered listing tools (manual): search_listings, get_listing_details, get_listings_details_bulk")
+
+
+# Shown instead of a price for listings without one (search / details output)
+_NO_PRICE = "Preis auf Anfrage"
+_NO_PRICE_DETAILS = "Price: On request"
+
+# One search result in the tool output; desc_line is empty or a full line
+_LISTING_TMPL = "{idx}. [{title}]\n   ID: {adid}\n   Price: {price}\n{desc_line}   URL: {url}\n"
+
+
+# Limits for search arguments, see _validate_search_args()
+MAX_PAGE_COUNT = 20
+MAX_RADIUS_KM = 200
+# Each listing is a browser navigation, so bound the bulk tool like page_count
+MAX_BULK_LISTINGS = 20
+# Postal code or place name, e.g. "78464", "Frankfurt am Main", "Halle (Saale)"
+_LOCATION_PATTERN = re.compile(r"[\w .,()/-]{1,100}")
+
+# Formatted responses for repeated searches with the same arguments. Listing
+# details are cached (and concurrent fetches shared) by the client instead,
+# which also covers the bulk tool.
+_search_cache: TTLCache[Tuple[str, ...]] = TTLCache(512, float(os.environ.get("SEARCH_CACHE_TTL", "60")))
+# Searches in progress, see _coalesce()
+_inflight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+# Price ranges that returned nothing, per (query, location, radius). A narrower
+# range within one of them is empty too. Kept briefly, new listings can show up.
+_empty_searches: TTLCache[List[Tuple[Optional[int], Optional[int]]]] = TTLCache(
+    512, min(30.0, _search_cache.ttl)
+)
+
+
+async def _coalesce(key: Hashable, fetch: Callable[[], Awaitable[T]]) -> T:
+    """
+    Run fetch() for key unless a call for the same key is already running,
+    in which case wait for that one instead.
+    """
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch())
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    # Shield so one caller giving up doesn't cancel the fetch for the others
+    return await asyncio.shield(task)
+
+
+def _validate_search_args(
+    location: Optional[str],
+    radius: Optional[int],
+    min_price: Optional[int],
+    max_price: Optional[int],
+    page_count: Optional[int]
+) -> Tuple[Optional[str], Optional[int], Optional[int], Optional[int], int]:
+    """
+    Clamp numeric search arguments to their valid ranges.
+    
+    A blank location means no location filter, clients often send "" for
+    optional arguments.
+    
+    Returns (location, radius, min_price, max_price, page_count).
     
-    logger.info("Registered listing tools (manual): search_listings, get_listing_details")
+    Raises:
+        ValueError: If the location or price range can't be searched
+    """
+    if location is not None and not location.strip():
+        location = None
+    if location is not None and not _LOCATION_PATTERN.fullmatch(location):
+        raise ValueError(f"location '{location}' is not a postal code or place name")
+    page_count = max(1, min(int(page_count or 1), MAX_PAGE_COUNT))
+    if radius is not None:
+        radius = max(0, min(int(radius), MAX_RADIUS_KM))
+    if min_price is not None:
+        min_price = max(0, int(min_price))
+    if max_price is not None:
+        max_price = max(0, int(max_price))
+    if min_price is not None and max_price is not None and min_price > max_price:
+        raise ValueError(f"min_price ({min_price}) is greater than max_price ({max_price})")
+    return location, radius, min_price, max_price, page_count
+
+
+def _search_cache_key(
+    query: Optional[str],
+    location: Optional[str],
+    radius: Optional[int],
+    min_price: Optional[int],
+    max_price: Optional[int],
+    page_count: int
+) -> Tuple:
+    """Normalize search arguments so equivalent searches share a cache entry."""
+    return (
+        query.strip().lower() if query else None,
+        location.strip().lower() if location else None,
+        radius, min_price, max_price, page_count
+    )
+
+
+def _is_known_empty(cache_key: Tuple) -> bool:
+    """Whether an earlier search with the same terms and a wider price range found nothing."""
+    *base, min_price, max_price, _page_count = cache_key
+    for empty_min, empty_max in _empty_searches.get(tuple(base)) or ():
+        if (min_price or 0) >= (empty_min or 0) and (
+            empty_max is None or (max_price is not None and max_price <= empty_max)
+        ):
+            return True
+    return False
+
+
+def _remember_empty(cache_key: Tuple):
+    """Record the price range of a search that returned no listings."""
+    *base, min_price, max_price, _page_count = cache_key
+    terms = tuple(base)
+    _empty_searches.set(terms, [*(_empty_searches.get(terms) or ()), (min_price, max_price)])
+
+
+def _no_results_message(
+    query: Optional[str],
+    location: Optional[str],
+    min_price: Optional[int],
+    max_price: Optional[int]
+) -> str:
+    """Build the "no results" response with the filters that were used."""
+    filters = []
+    if query:
+        filters.append(f"query: {query}")
+    if location:
+        filters.append(f"location: {location}")
+    if min_price or max_price:
+        price_range = f"{min_price or 0}€ - {max_price or '∞'}€"
+        filters.append(f"price: {price_range}")
+    
+    filter_text = ", ".join(filters) if filters else "no filters"
+    return f"No listings found for search ({filter_text}). Try broader criteria."
+
+
+def _log_tool_error(message: str, error: BaseException) -> None:
+    """Log a failed tool call; tracebacks are only formatted at DEBUG level."""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s: %s", message, error, exc_info=error)
+    else:
+        logger.warning("%s: %s: %s", message, type(error).__name__, error)
+
+
+# Called with the 1-based index and formatted block of each listing as it arrives
+ListingCallback = Callable[[int, str], Awaitable[None]]
 
 
 # Shared implementation functions
@@ -175,131 +388,218 @@ async def _search_listings_impl(
     radius: Optional[int] = None,
     min_price: Optional[int] = None,
     max_price: Optional[int] = None,
-    page_count: int = 1
+    page_count: int = 1,
+    on_listing: Optional[ListingCallback] = None
 ) -> str:
     """Shared implementation for search_listings."""
-    async with KleinanzeigenClient() as client:
-        try:
-            results = await client.search_listings(
-                query=query,
-                location=location,
-                radius=radius,
-                min_price=min_price,
-                max_price=max_price,
-                page_count=page_count
+    chunks = await _search_listings_chunks(
+        query, location, radius, min_price, max_price, page_count, on_listing
+    )
+    return "\n".join(chunks)
+
+
+async def _search_listings_chunks(
+    query: Optional[str] = None,
+    location: Optional[str] = None,
+    radius: Optional[int] = None,
+    min_price: Optional[int] = None,
+    max_price: Optional[int] = None,
+    page_count: int = 1,
+    on_listing: Optional[ListingCallback] = None
+) -> Tuple[str, ...]:
+    """
+    Search and return the response as separate chunks: the header followed
+    by one block per listing, or a single message if there is nothing to show.
+    Joined with newlines they give the search_listings response.
+    """
+    # Reject or clamp bad arguments before anything touches the network
+    try:
+        location, radius, min_price, max_price, page_count = _validate_search_args(
+            location, radius, min_price, max_price, page_count
+        )
+    except (TypeError, ValueError) as e:
+        return (f"Invalid search parameters: {e}",)
+    if not (query or location or min_price is not None or max_price is not None):
+        return ("No search filters given. Provide at least a query or a location.",)
+    
+    cache_key = _search_cache_key(query, location, radius, min_price, max_price, page_count)
+    cached = _search_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    if _is_known_empty(cache_key):
+        return (_no_results_message(query, location, min_price, max_price),)
+    
+    # Identical searches running at the same time share one fetch; only the
+    # first caller's on_listing sees progress
+    return await _coalesce(("search", cache_key), lambda: _fetch_search_chunks(
+        cache_key, query, location, radius, min_price, max_price, page_count, on_listing
+    ))
+
+
+async def _fetch_search_chunks(
+    cache_key: Tuple,
+    query: Optional[str],
+    location: Optional[str],
+    radius: Optional[int],
+    min_price: Optional[int],
+    max_price: Optional[int],
+    page_count: int,
+    on_listing: Optional[ListingCallback]
+) -> Tuple[str, ...]:
+    """Run a search that missed the caches and format it as chunks."""
+    try:
+        client = await get_client()
+        
+        # Format results for Claude, one multi-line block per listing, as
+        # each result page comes in
+        output_lines = []
+        idx = 0
+        async for listing in client.iter_listings(
+            query=query,
+            location=location,
+            radius=radius,
+            min_price=min_price,
+            max_price=max_price,
+            page_count=page_count
+        ):
+            idx += 1
+            price = listing.price
+            price_display = _NO_PRICE if price is None else f"{price}€"
+            desc = listing.description
+            desc_line = ""
+            if desc:
+                # Truncate long descriptions (a 101st character exists)
+                if desc[100:101]:
+                    desc = desc[:100] + "..."
+                desc_line = f"   Description: {desc}\n"
+            block = _LISTING_TMPL.format(
+                idx=idx,
+                title=listing.title,
+                adid=listing.adid,
+                price=price_display,
+                desc_line=desc_line,
+                url=listing.url
             )
-            
-            if not results:
-                # Build context for "no results" message
-                filters = []
-                if query:
-                    filters.append(f"query: {query}")
-                if location:
-                    filters.append(f"location: {location}")
-                if min_price or max_price:
-                    price_range = f"{min_price or 0}€ - {max_price or '∞'}€"
-                    filters.append(f"price: {price_range}")
-                
-                filter_text = ", ".join(filters) if filters else "no filters"
-                return f"No listings found for search ({filter_text}). Try broader criteria."
-            
-            # Format results for Claude
-            output_lines = [
-                f"Found {len(results)} listings:",
-                ""
-            ]
-            
-            for idx, listing in enumerate(results, 1):
-                price_display = f"{listing.price}€" if listing.price else "Preis auf Anfrage"
-                output_lines.append(f"{idx}. [{listing.title}]")
-                output_lines.append(f"   ID: {listing.adid}")
-                output_lines.append(f"   Price: {price_display}")
-                if listing.description:
-                    # Truncate long descriptions
-                    desc = listing.description[:100] + "..." if len(listing.description) > 100 else listing.description
-                    output_lines.append(f"   Description: {desc}")
-                output_lines.append(f"   URL: {listing.url}")
-                output_lines.append("")
-            
-            return "\n".join(output_lines)
-            
-        except Exception as e:
-            logger.error(f"Search failed: {e}", exc_info=True)
-            return f"Search error: {str(e)}. Please check your parameters and try again."
+            output_lines.append(block)
+            if on_listing is not None:
+                try:
+                    await on_listing(idx, block)
+                except Exception as e:
+                    # Progress is optional; a gone client mustn't fail the
+                    # search for it or for callers sharing this fetch
+                    _log_tool_error("Progress report failed, continuing without progress", e)
+                    on_listing = None
+        
+        logger.info("Search completed: %s listings found", idx)
+        
+        if not output_lines:
+            # iter_listings raises if the first page couldn't be read, so
+            # this is the site's own empty results page
+            _remember_empty(cache_key)
+            return (_no_results_message(query, location, min_price, max_price),)
+        
+        chunks = (f"Found {idx} listings:\n", *output_lines)
+        _search_cache.set(cache_key, chunks)
+        return chunks
+        
+    except Exception as e:
+        _log_tool_error("Search failed", e)
+        return (f"Search error: {str(e)}. Please check your parameters and try again.",)
 
 
 async def _get_listing_details_impl(listing_id: str) -> str:
     """Shared implementation for get_listing_details."""
-    async with KleinanzeigenClient() as client:
-        try:
-            details = await client.get_listing_details(listing_id)
-            
-            # Format comprehensive output for Claude
-            output_lines = [
-                f"=== LISTING DETAILS ===",
-                "",
-                f"Title: {details.title}",
-                f"ID: {details.id}",
-                f"Status: {details.status}",
-                f"Price: {details.price}€" if details.price else "Price: On request",
-                f"Views: {details.views}",
-                ""
-            ]
-            
-            # Categories
-            if details.categories:
-                output_lines.append(f"Categories: {' > '.join(details.categories)}")
-                output_lines.append("")
-            
-            # Description
-            if details.description:
-                output_lines.append("Description:")
-                output_lines.append(details.description)
-                output_lines.append("")
-            
-            # Location and delivery
-            if details.location:
-                output_lines.append(f"Location: {details.location.get('raw', 'Not specified')}")
-            if details.delivery:
-                delivery_text = "Pickup only" if details.delivery == "pickup" else "Shipping available"
-                output_lines.append(f"Delivery: {delivery_text}")
-            if details.location or details.delivery:
-                output_lines.append("")
-            
-            # Images
-            if details.images:
-                output_lines.append(f"Images ({len(details.images)}):")
-                for idx, img_url in enumerate(details.images[:5], 1):  # Limit to first 5
-                    output_lines.append(f"  {idx}. {img_url}")
-                if len(details.images) > 5:
-                    output_lines.append(f"  ... and {len(details.images) - 5} more")
-                output_lines.append("")
-            
-            # Details section
-            if details.details:
-                output_lines.append("Details:")
-                for key, value in details.details.items():
-                    output_lines.append(f"  {key}: {value}")
-                output_lines.append("")
-            
-            # Features
-            if details.features:
-                output_lines.append("Features:")
-                for key, value in details.features.items():
-                    output_lines.append(f"  {key}: {value}")
-                output_lines.append("")
-            
-            # Seller information
-            if details.seller:
-                output_lines.append("Seller:")
-                for key, value in details.seller.items():
-                    output_lines.append(f"  {key}: {value}")
-                output_lines.append("")
-            
-            output_lines.append(f"View online: https://www.kleinanzeigen.de/s-anzeige/{details.id}")
-            
-            return "\n".join(output_lines)
-            
-        except Exception as e:
-            logger.error(f"Failed to fetch listing details: {e}", exc_info=True)
-            return f"Error fetching listing {listing_id}: {str(e)}. Please verify the ID is correct."
+    try:
+        client = await get_client()
+        details = await client.get_listing_details(listing_id)
+        return _format_listing_details(details)
+        
+    except Exception as e:
+        _log_tool_error("Failed to fetch listing details", e)
+        return f"Error fetching listing {listing_id}: {str(e)}. Please verify the ID is correct."
+
+
+async def _get_listings_details_bulk_impl(listing_ids: List[str]) -> str:
+    """Shared implementation for get_listings_details_bulk."""
+    if not listing_ids:
+        return "No listing IDs given. Pass the IDs from search_listings results."
+    # Fetch each listing once, keeping the order of first appearance
+    listing_ids = list(dict.fromkeys(listing_ids))
+    if len(listing_ids) > MAX_BULK_LISTINGS:
+        return (
+            f"Too many listing IDs ({len(listing_ids)}). "
+            f"Request at most {MAX_BULK_LISTINGS} listings per call."
+        )
+    
+    try:
+        client = await get_client()
+        results = await client.get_listings_details(listing_ids)
+    except Exception as e:
+        _log_tool_error("Bulk detail fetch failed", e)
+        return f"Error fetching listings: {str(e)}. Please try again."
+    
+    sections = []
+    for listing_id, result in zip(listing_ids, results):
+        # gather() can also hand back a CancelledError, which isn't an Exception
+        if isinstance(result, BaseException):
+            _log_tool_error("Failed to fetch listing details", result)
+            sections.append(f"Error fetching listing {listing_id}: {str(result)}. Please verify the ID is correct.")
+        else:
+            sections.append(_format_listing_details(result))
+    
+    return "\n\n".join(sections)
+
+
+def _format_listing_details(details: ListingDetails) -> str:
+    """Format listing details as text for the LLM."""
+    return "\n".join(_iter_listing_details_lines(details))
+
+
+def _iter_listing_details_lines(details: ListingDetails) -> Iterator[str]:
+    """Yield the lines (or multi-line blocks) of the details output."""
+    # Format comprehensive output for Claude
+    yield "=== LISTING DETAILS ===\n"
+    yield f"Title: {details.title}"
+    yield f"ID: {details.id}"
+    yield f"Status: {details.status}"
+    yield _NO_PRICE_DETAILS if details.price is None else f"Price: {details.price}€"
+    yield f"Views: {details.views}\n"
+    
+    # Categories
+    if details.categories:
+        yield f"Categories: {' > '.join(details.categories)}\n"
+    
+    # Description
+    if details.description:
+        yield f"Description:\n{details.description}\n"
+    
+    # Location and delivery
+    if details.location:
+        yield f"Location: {details.location.get('raw', 'Not specified')}"
+    if details.delivery:
+        delivery_text = "Pickup only" if details.delivery == "pickup" else "Shipping available"
+        yield f"Delivery: {delivery_text}"
+    if details.location or details.delivery:
+        yield ""
+    
+    # Images
+    if details.images:
+        yield f"Images ({len(details.images)}):"
+        for idx, img_url in enumerate(details.images[:5], 1):  # Limit to first 5
+            yield f"  {idx}. {img_url}"
+        if len(details.images) > 5:
+            yield f"  ... and {len(details.images) - 5} more"
+        yield ""
+    
+    # Details, features and seller information
+    for heading, section in (
+        ("Details", details.details),
+        ("Features", details.features),
+        ("Seller", details.seller),
+    ):
+        if section:
+            yield f"{heading}:"
+            yield "\n".join(f"  {key}: {value}" for key, value in section.items())
+            yield ""
+    
+    yield f"View online: https://www.kleinanzeigen.de/s-anzeige/{details.id}"
@@ -1,9 +1,9 @@
 """Types and data models for Kleinanzeigen MCP Server."""
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, TypedDict
 
 
-@dataclass
+@dataclass(slots=True)
 class ListingSearchParams:
     """Parameters for searching listings."""
     query: Optional[str] = None
@@ -14,32 +14,42 @@ class ListingSearchParams:
     page_count: int = 1
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ListingSummary:
     """Summary information from search results."""
     adid: str
     url: str
     title: str
-    price: str
+    price: Optional[int]
     description: str
 
 
-@dataclass
+class Location(TypedDict, total=False):
+    """Location of a listing as shown on the detail page."""
+    raw: str  # e.g. "78464 Konstanz - Altstadt"
+
+
+class Seller(TypedDict, total=False):
+    """Seller information from the detail page."""
+    name: str
+
+
+@dataclass(slots=True, frozen=True)
 class ListingDetails:
     """Complete listing information."""
     id: str
     categories: List[str]
     title: str
     status: str
-    price: Optional[str]
+    price: Optional[int]
     delivery: Optional[str]
-    location: Optional[Dict[str, Any]]
+    location: Optional[Location]
     views: str
     description: str
     images: List[str]
     details: Dict[str, Any]
     features: Dict[str, Any]
-    seller: Dict[str, Any]
+    seller: Seller
     extra_info: Dict[str, Any]
 
 
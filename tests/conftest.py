@@ -1,7 +1,9 @@
 """
 Pytest configuration for Kleinanzeigen MCP Server tests.
 """
+import importlib
 import pytest
+import pytest_asyncio
 import os
 
 
@@ -15,12 +17,28 @@ def pytest_addoption(parser):
     )
 
 
+# Modules that must import cleanly; checked once before collection
+_SMOKE_IMPORT_MODULES = (
+    "kleinanzeigen_mcp.client",
+    "kleinanzeigen_mcp.server",
+    "kleinanzeigen_mcp.tools.listings",
+    "kleinanzeigen_mcp.prompts.workflows",
+)
+
+
 def pytest_configure(config):
-    """Register custom markers."""
+    """Register custom markers, check imports and switch to the server's event loop."""
     config.addinivalue_line(
         "markers",
         "integration: Integration tests that hit real website (deselected by default)"
     )
+    for module in _SMOKE_IMPORT_MODULES:
+        importlib.import_module(module)
+    # Imported only after the smoke check so a broken module fails there
+    from kleinanzeigen_mcp.server import install_uvloop
+
+    # Run async tests on uvloop like the server does (no-op where unavailable)
+    install_uvloop()
 
 
 def pytest_collection_modifyitems(config, items):
@@ -33,3 +51,19 @@ def pytest_collection_modifyitems(config, items):
     for item in items:
         if "integration" in item.keywords:
             item.add_marker(skip_integration)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def shared_client():
+    """
+    One started client (Playwright + browser) for the whole test session.
+    
+    Launching Chromium takes seconds, so integration tests share it. Tests
+    that need isolation can open their own context via new_context().
+    """
+    from kleinanzeigen_mcp.client import KleinanzeigenClient
+
+    client = KleinanzeigenClient()
+    await client.start()
+    yield client
+    await client.close()
@@ -6,27 +6,18 @@
 from kleinanzeigen_mcp.types import ListingSummary, ListingDetails
 
 
-def test_imports():
-    """Test that all modules can be imported."""
-    from kleinanzeigen_mcp.client import KleinanzeigenClient
-    from kleinanzeigen_mcp.server import main
-    from kleinanzeigen_mcp.tools.listings import register_listing_tools
-    from kleinanzeigen_mcp.prompts.workflows import register_prompts
-    assert True
-
-
 def test_listing_summary_structure():
     """Test ListingSummary dataclass structure."""
     listing = ListingSummary(
         adid="123",
         url="https://example.com",
         title="Test Item",
-        price="100€",
+        price=100,
         description="Test description"
     )
     assert listing.adid == "123"
     assert listing.title == "Test Item"
-    assert listing.price == "100€"
+    assert listing.price == 100
 
 
 def test_listing_details_structure():
@@ -36,9 +27,9 @@ def test_listing_details_structure():
         categories=["Electronics"],
         title="Test Item",
         status="active",
-        price="100€",
+        price=100,
         delivery="shipping",
-        location={"city": "Berlin"},
+        location={"raw": "10178 Berlin - Mitte"},
         views="100",
         description="Test description",
         images=["https://example.com/1.jpg"],
@@ -51,3 +42,266 @@ def test_listing_details_structure():
     assert details.title == "Test Item"
     assert isinstance(details.images, list)
     assert isinstance(details.details, dict)
+
+
+def test_extract_listings_from_html():
+    """Test search result parsing on the HTTP fast path."""
+    from selectolax.lexbor import LexborHTMLParser
+    from kleinanzeigen_mcp.client import KleinanzeigenClient
+    
+    html = """
+    <ul>
+      <li class="ad-listitem">
+        <article data-adid="123" data-href="/s-anzeige/test/123">
+          <h2 class="text-module-begin"><a class="ellipsis">Test Laptop</a></h2>
+          <p class="aditem-main--middle--price-shipping--price">1.200 € VB</p>
+          <p class="aditem-main--middle--description">Gut <b>erhalten</b> und <i>sauber</i></p>
+        </article>
+      </li>
+      <li class="ad-listitem is-topad">
+        <article data-adid="999" data-href="/s-anzeige/topad/999"></article>
+      </li>
+    </ul>
+    """
+    client = KleinanzeigenClient()
+    results = client._extract_listings_from_html(LexborHTMLParser(html))
+    
+    assert len(results) == 1
+    assert results[0].adid == "123"
+    assert results[0].url == "https://www.kleinanzeigen.de/s-anzeige/test/123"
+    assert results[0].title == "Test Laptop"
+    assert results[0].price == 1200
+    # Inline markup doesn't glue words together
+    assert results[0].description == "Gut erhalten und sauber"
+    
+    # The HTTP path hands over the raw response body
+    assert client._parse_search_html(html.encode()) == results
+
+
+def test_price_parsing():
+    """Test price parsing logic."""
+    from kleinanzeigen_mcp.client import KleinanzeigenClient
+    
+    assert KleinanzeigenClient._parse_price("123 €") == 123
+    assert KleinanzeigenClient._parse_price("1.000 € VB") == 1000
+    assert KleinanzeigenClient._parse_price("12,50 €") == 12
+    assert KleinanzeigenClient._parse_price("") is None
+    assert KleinanzeigenClient._parse_price("VB") is None
+    assert KleinanzeigenClient._parse_price("Zu verschenken") == 0
+
+
+def test_build_search_url_template():
+    """Test search URL assembly with filters."""
+    from kleinanzeigen_mcp.client import _build_search_url_template
+    
+    base_url = "https://www.kleinanzeigen.de"
+    assert _build_search_url_template(base_url, None, None, None, None, None) == (
+        "https://www.kleinanzeigen.de/s-seite:{page}"
+    )
+    url = _build_search_url_template(base_url, "gaming pc", "10178", 20, None, 500)
+    assert url == (
+        "https://www.kleinanzeigen.de/preis::500/s-seite:{page}"
+        "?keywords=gaming+pc&locationStr=10178&radius=20"
+    )
+    assert url.format(page=2).startswith("https://www.kleinanzeigen.de/preis::500/s-seite:2?")
+
+
+def test_ttl_cache():
+    """Test TTL expiry and LRU eviction of the response cache."""
+    from kleinanzeigen_mcp.cache import TTLCache
+    
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    
+    expired = TTLCache(maxsize=2, ttl=0)
+    expired.set("a", 1)
+    assert expired.get("a") is None
+    
+    # Per-entry TTL overrides the cache-wide one
+    cache.set("d", 4, ttl=0)
+    assert cache.get("d") is None
+    expired.set("d", 4, ttl=60)
+    assert expired.get("d") == 4
+
+
+def test_validate_search_args():
+    """Test clamping and rejection of search tool arguments."""
+    from kleinanzeigen_mcp.tools.listings import _validate_search_args
+    
+    # page_count is clamped to 1..20
+    assert _validate_search_args(None, None, None, None, 0)[4] == 1
+    assert _validate_search_args(None, None, None, None, 100)[4] == 20
+    # Negative prices become 0
+    assert _validate_search_args(None, None, -5, -1, 1)[2:4] == (0, 0)
+    # Blank location means no location filter
+    assert _validate_search_args("", None, None, None, 1)[0] is None
+    assert _validate_search_args("   ", None, None, None, 1)[0] is None
+    assert _validate_search_args("Halle (Saale)", None, None, None, 1)[0] == "Halle (Saale)"
+    
+    with pytest.raises(ValueError):
+        _validate_search_args(None, None, 500, 100, 1)  # inverted range
+    with pytest.raises(ValueError):
+        _validate_search_args(None, None, "abc", None, 1)  # non-numeric
+    with pytest.raises(ValueError):
+        _validate_search_args("<script>", None, None, None, 1)
+
+
+def test_known_empty_price_ranges():
+    """Test that narrower price ranges of an empty search count as empty."""
+    from kleinanzeigen_mcp.tools.listings import (
+        _empty_searches, _is_known_empty, _remember_empty, _search_cache_key
+    )
+    
+    def key(min_price, max_price, query="xyz"):
+        return _search_cache_key(query, None, None, min_price, max_price, 1)
+    
+    _empty_searches.clear()
+    _remember_empty(key(100, 500))
+    assert _is_known_empty(key(100, 500))
+    assert _is_known_empty(key(200, 300))  # narrower
+    assert not _is_known_empty(key(50, 500))  # wider
+    assert not _is_known_empty(key(100, None))  # open upper bound is wider
+    assert not _is_known_empty(key(None, 300))  # open lower bound is wider
+    assert not _is_known_empty(key(200, 300, query="other"))
+    
+    # An unbounded empty search covers every price range
+    _remember_empty(key(None, None, query="nothing"))
+    assert _is_known_empty(key(None, 300, query="nothing"))
+    assert _is_known_empty(key(10, None, query="nothing"))
+    _empty_searches.clear()
+
+
+@pytest.mark.asyncio
+async def test_bulk_details_limit():
+    """Test that the bulk tool rejects too many IDs before fetching anything."""
+    from kleinanzeigen_mcp.tools.listings import MAX_BULK_LISTINGS, _get_listings_details_bulk_impl
+    
+    too_many = [str(i) for i in range(MAX_BULK_LISTINGS + 1)]
+    assert (await _get_listings_details_bulk_impl(too_many)).startswith("Too many listing IDs")
+    assert (await _get_listings_details_bulk_impl([])).startswith("No listing IDs")
+
+
+@pytest.mark.asyncio
+async def test_bulk_details_schema_limit():
+    """Test that the FastMCP bulk tool advertises the same limit as the manual schema."""
+    from mcp.server.fastmcp import FastMCP
+    from kleinanzeigen_mcp.tools.listings import MAX_BULK_LISTINGS, register_listing_tools
+    
+    mcp = FastMCP("test")
+    register_listing_tools(mcp)
+    tools = {tool.name: tool for tool in await mcp.list_tools()}
+    schema = tools["get_listings_details_bulk"].inputSchema
+    assert schema["properties"]["listing_ids"]["maxItems"] == MAX_BULK_LISTINGS
+
+
+@pytest.mark.asyncio
+async def test_search_survives_failing_progress_callback(monkeypatch):
+    """Test that a raising progress callback doesn't turn the search into an error."""
+    from kleinanzeigen_mcp.tools import listings
+    
+    class FakeClient:
+        async def iter_listings(self, **kwargs):
+            for adid in ("1", "2"):
+                yield ListingSummary(
+                    adid=adid, url=f"https://example.com/{adid}",
+                    title=f"Item {adid}", price=10, description=""
+                )
+    
+    async def fake_get_client():
+        return FakeClient()
+    
+    calls = []
+    
+    async def failing_callback(idx, block):
+        calls.append(idx)
+        raise RuntimeError("session closed")
+    
+    monkeypatch.setattr(listings, "get_client", fake_get_client)
+    response = await listings._search_listings_impl(
+        query="progress-callback-test", on_listing=failing_callback
+    )
+    
+    assert response.startswith("Found 2 listings:")
+    # Progress is turned off after the first failure
+    assert calls == [1]
+
+
+@pytest.mark.asyncio
+async def test_failed_start_cleans_up(monkeypatch):
+    """Test that a failing start() closes what it already set up."""
+    import httpx
+    from kleinanzeigen_mcp.client import CONTEXT_POOL_SIZE, KleinanzeigenClient, SearchError
+    
+    closed = []
+    
+    class FakeContext:
+        async def route(self, *args):
+            pass
+        
+        async def close(self):
+            closed.append(self)
+    
+    class FakeBrowser:
+        async def new_context(self, **opts):
+            if opts.get("java_script_enabled") is False:
+                raise RuntimeError("browser crashed")
+            return FakeContext()
+    
+    browser = FakeBrowser()
+    released = []
+    
+    async def fake_acquire(cls):
+        return browser
+    
+    async def fake_release(cls, b):
+        released.append(b)
+    
+    original_aclose = httpx.AsyncClient.aclose
+    
+    async def recording_aclose(self):
+        closed.append(self)
+        await original_aclose(self)
+    
+    monkeypatch.setattr(KleinanzeigenClient, "_acquire_browser", classmethod(fake_acquire))
+    monkeypatch.setattr(KleinanzeigenClient, "_release_browser", classmethod(fake_release))
+    monkeypatch.setattr(httpx.AsyncClient, "aclose", recording_aclose)
+    
+    client = KleinanzeigenClient()
+    with pytest.raises(SearchError):
+        await client.start()
+    
+    # The HTTP client and every pooled context created before the failure
+    assert len(closed) == CONTEXT_POOL_SIZE + 1
+    assert released == [browser]
+    assert client.http is None and client.browser is None
+    assert client._context_pool is None and client._nojs_context is None
+
+
+def test_format_free_listing_price():
+    """Test that free items are shown as 0€, not as price on request."""
+    from kleinanzeigen_mcp.tools.listings import _NO_PRICE_DETAILS, _format_listing_details
+    
+    details = ListingDetails(
+        id="123",
+        categories=[],
+        title="Sofa",
+        status="active",
+        price=0,
+        delivery=None,
+        location=None,
+        views="1",
+        description="",
+        images=[],
+        details={},
+        features={},
+        seller={},
+        extra_info={}
+    )
+    text = _format_listing_details(details)
+    assert "Price: 0€" in text
+    assert _NO_PRICE_DETAILS not in text